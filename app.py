@@ -5,7 +5,8 @@ Tic‑Tac‑Toe FastAPI entry point.
 This module is responsible for:
 - Creating the FastAPI application instance.
 - Configuring static file and Jinja2 template handling so the front‑end assets
-  can be served by the same process that hosts the JSON API.
+  can be served by the same process that hosts the JSON API.  Assets are
+  hashed and precompressed at startup and *index.html* is rendered only once.
 - Registering the API routes defined in *routers/game_router.py* under the
   "/api" prefix.
 - Providing a root endpoint that returns the HTML page where the user can play
@@ -14,14 +15,18 @@ This module is responsible for:
   monitoring.
 
 Run locally with:
-    uvicorn app:app --reload
+    uvicorn app:app --reload --reload-include "static/*" --reload-include "templates/*"
+
+Static files and the index page are loaded once at startup, so the extra
+*--reload-include* patterns are needed for front‑end edits to show up.
 """
 
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
-from routers.game_router import router as game_router
+from routers.game_router import router as game_router, ai_admission
+from routers.static_router import router as static_router, asset_url, load_assets
+from routers.http_cache import CachedAsset, REVALIDATE_CACHE
 from game_logic import database  # Import database to ensure initialization runs on startup
 import os
 
@@ -37,10 +42,12 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 static_dir = os.path.join(current_dir, "static")
 templates_dir = os.path.join(current_dir, "templates")
 
-# Mount the directory that contains CSS / JS / images at the URL path "/static".
-# This allows the front‑end to request, e.g. /static/style.css.
+# Load the CSS / JS / images into memory and serve them at "/static".  Each
+# file is available as e.g. /static/style.css and, with long‑lived caching,
+# under its content‑hashed name such as /static/style.1a2b3c4d5e.css.
 if os.path.isdir(static_dir):
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
+    load_assets(static_dir)
+    app.include_router(static_router)
 else:
     # Failing silently would make debugging difficult, so print a warning.
     print(f"Warning: Static directory not found at {static_dir}")
@@ -53,6 +60,14 @@ else:
     print(f"Warning: Templates directory not found at {templates_dir}")
     templates = None  # Fallback when templates are missing
 
+# The index page has no per‑request data, so render it once (with hashed asset
+# URLs) and keep the compressed bytes around instead of hitting Jinja2 on
+# every request.
+index_page = None
+if templates:
+    index_html = templates.get_template("index.html").render(asset_url=asset_url)
+    index_page = CachedAsset(index_html.encode("utf-8"), "text/html; charset=utf-8")
+
 # --- Include API Routers ---
 # All JSON endpoints for the game are grouped in *game_router* and mounted under
 # "/api".  Tagging them as "Game API" improves the automatically generated docs
@@ -66,9 +81,9 @@ app.include_router(game_router, prefix="/api", tags=["Game API"])
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
     """Return the main web page or a 500 error if templates are unavailable."""
-    if templates:
-        # Jinja2 needs the *request* in the context for url_for() to work.
-        return templates.TemplateResponse("index.html", {"request": request})
+    if index_page:
+        # Pre‑rendered page; answers 304 when the browser's ETag still matches.
+        return index_page.response(request, REVALIDATE_CACHE)
     else:
         return HTMLResponse(
             "<html><body><h1>Error: Template directory not found.</h1></body></html>",
@@ -78,8 +93,11 @@ async def read_root(request: Request):
 
 @app.get("/health")
 async def health_check():
-    """Simple liveness probe endpoint used by orchestration platforms."""
-    return {"status": "ok"}
+    """Simple liveness probe endpoint used by orchestration platforms.
+
+    Also reports the AI admission budgets so overload is visible to monitoring.
+    """
+    return {"status": "ok", "ai_admission": ai_admission.stats()}
 
 # Database initialisation is executed when *game_logic.database* is imported at
 # the top of this file, therefore no explicit startup hook is necessary.
@@ -91,8 +109,12 @@ if __name__ == "__main__":
     import uvicorn
 
     print("Starting server with Uvicorn...")
-    # During development you can simply execute: uvicorn app:app --reload
+    # During development you can simply execute the uvicorn command shown in
+    # the module docstring (with --reload and --reload-include).
     # The explicit call below is commented out because running the module with
     # `python app.py` is less common in modern ASGI deployments.
     # uvicorn.run(app, host="127.0.0.1", port=8000)
-    print("Hint: Run the server using the command: uvicorn app:app --reload")
\ No newline at end of file
+    print(
+        "Hint: Run the server using the command: uvicorn app:app --reload "
+        '--reload-include "static/*" --reload-include "templates/*"'
+    )
\ No newline at end of file
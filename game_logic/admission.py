@@ -0,0 +1,177 @@
+"""Admission control for expensive AI computations.
+
+A burst of *hard* requests keeps the worker busy running Minimax, so every AI
+computation has to obtain a slot from :class:`AdmissionController` first.
+Slots are budgeted separately per ``(difficulty, board_size)`` and each budget
+has a small bounded wait queue.  When a budget is exhausted the request is
+either rejected (the API answers 503 + Retry‑After) or degraded to a cheaper
+difficulty, depending on the configured policy.
+
+``PlayRequest`` currently fixes the board at 9 squares, so the board‑size
+dimension has a single value for now; it is kept so larger boards get their
+own budgets once they are supported.
+
+Configuration is read from environment variables when the module is imported:
+
+* ``TTT_AI_LIMIT_<DIFFICULTY>_<BOARD_SIZE>`` – concurrency for one budget,
+  e.g. ``TTT_AI_LIMIT_HARD_9=2``.
+* ``TTT_AI_LIMIT_<DIFFICULTY>`` – concurrency for every board size of that
+  difficulty (used when the size‑specific variable is missing).
+* ``TTT_AI_QUEUE_SIZE`` – how many requests may wait for each budget.
+* ``TTT_AI_QUEUE_TIMEOUT`` – seconds a queued request waits before giving up.
+* ``TTT_AI_OVERLOAD_POLICY`` – ``reject`` (default) or ``degrade``.
+* ``TTT_AI_RETRY_AFTER`` – value, in seconds, of the Retry‑After header.
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+# Cheapest difficulty last; *degrade* walks this list from the requested level.
+DIFFICULTY_ORDER = ["hard", "medium", "easy"]
+
+# Default concurrent computations per difficulty (for each board size).
+DEFAULT_LIMITS: Dict[str, int] = {"hard": 2, "medium": 4, "easy": 16}
+
+POLICY_REJECT = "reject"
+POLICY_DEGRADE = "degrade"
+
+
+class AdmissionRejected(Exception):
+    """Raised when no budget can admit the request right now."""
+
+    def __init__(self, difficulty: str, board_size: int, retry_after: int):
+        super().__init__(
+            f"AI is overloaded for difficulty '{difficulty}' on a board of "
+            f"{board_size} squares."
+        )
+        self.difficulty = difficulty
+        self.board_size = board_size
+        self.retry_after = retry_after
+
+
+class _Budget:
+    """Concurrency slots plus a bounded wait queue for one key."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self.waiting = 0
+        self.semaphore = asyncio.Semaphore(limit)
+
+
+class AdmissionController:
+    """Hand out slots for AI computations, rejecting or degrading on overload."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        size_limits: Optional[Dict[Tuple[str, int], int]] = None,
+        max_queue: int = 4,
+        queue_timeout: float = 1.0,
+        policy: str = POLICY_REJECT,
+        retry_after: int = 1,
+    ):
+        if policy not in (POLICY_REJECT, POLICY_DEGRADE):
+            raise ValueError(f"Unknown overload policy: {policy}")
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.size_limits = dict(size_limits or {})
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.policy = policy
+        self.retry_after = retry_after
+        self._budgets: Dict[Tuple[str, int], _Budget] = {}
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        """Build a controller from the ``TTT_AI_*`` environment variables."""
+        limits = {
+            difficulty: int(os.environ.get(f"TTT_AI_LIMIT_{difficulty.upper()}", default))
+            for difficulty, default in DEFAULT_LIMITS.items()
+        }
+        size_limits = {}
+        for name, value in os.environ.items():
+            if not name.startswith("TTT_AI_LIMIT_"):
+                continue
+            difficulty, _, size = name[len("TTT_AI_LIMIT_"):].lower().partition("_")
+            if difficulty in DEFAULT_LIMITS and size.isdigit():
+                size_limits[(difficulty, int(size))] = int(value)
+        return cls(
+            limits=limits,
+            size_limits=size_limits,
+            max_queue=int(os.environ.get("TTT_AI_QUEUE_SIZE", 4)),
+            queue_timeout=float(os.environ.get("TTT_AI_QUEUE_TIMEOUT", 1.0)),
+            policy=os.environ.get("TTT_AI_OVERLOAD_POLICY", POLICY_REJECT).lower(),
+            retry_after=int(os.environ.get("TTT_AI_RETRY_AFTER", 1)),
+        )
+
+    # ---------------------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------------------
+    @asynccontextmanager
+    async def slot(self, difficulty: str, board_size: int):
+        """Hold a computation slot; yields the difficulty actually admitted.
+
+        With the *degrade* policy the yielded difficulty may be cheaper than
+        the requested one.  Raises :class:`AdmissionRejected` when nothing can
+        be admitted.
+        """
+        difficulty = str(getattr(difficulty, "value", difficulty))
+        budget, admitted = await self._acquire(difficulty, board_size)
+        budget.active += 1
+        try:
+            yield admitted
+        finally:
+            budget.active -= 1
+            budget.semaphore.release()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return limit / active / waiting counts per budget (shown by /health)."""
+        return {
+            f"{difficulty}:{size}": {
+                "limit": budget.limit,
+                "active": budget.active,
+                "waiting": budget.waiting,
+            }
+            for (difficulty, size), budget in self._budgets.items()
+        }
+
+    # ---------------------------------------------------------------------
+    # Internal helpers
+    # ---------------------------------------------------------------------
+    def _budget(self, difficulty: str, board_size: int) -> _Budget:
+        key = (difficulty, board_size)
+        if key not in self._budgets:
+            limit = self.size_limits.get(key, self.limits.get(difficulty, 1))
+            self._budgets[key] = _Budget(max(limit, 1))
+        return self._budgets[key]
+
+    async def _acquire(self, difficulty: str, board_size: int) -> Tuple[_Budget, str]:
+        if self.policy == POLICY_DEGRADE and difficulty in DIFFICULTY_ORDER:
+            candidates = DIFFICULTY_ORDER[DIFFICULTY_ORDER.index(difficulty):]
+        else:
+            candidates = [difficulty]
+
+        # Try every candidate without waiting first so a degraded answer is
+        # returned immediately instead of after a queue timeout.
+        for candidate in candidates:
+            budget = self._budget(candidate, board_size)
+            if not budget.semaphore.locked():
+                await budget.semaphore.acquire()
+                return budget, candidate
+
+        # Everything is busy – queue on the cheapest candidate if there is room.
+        candidate = candidates[-1]
+        budget = self._budget(candidate, board_size)
+        if budget.waiting >= self.max_queue:
+            raise AdmissionRejected(difficulty, board_size, self.retry_after)
+
+        budget.waiting += 1
+        try:
+            await asyncio.wait_for(budget.semaphore.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise AdmissionRejected(difficulty, board_size, self.retry_after)
+        finally:
+            budget.waiting -= 1
+        return budget, candidate
@@ -1,5 +1,6 @@
 import sqlite3
 import os
+import uuid
 from typing import Dict, Any
 
 # --- Configuration ---
@@ -16,6 +17,12 @@ _player_stats: Dict[str, Dict[str, int]] = {
     "Bot": {"score": 0, "win_streak": 0, "win_count": 0}  # Added a default Bot entry as well
 }
 
+# --- Scoreboard version (used for HTTP ETags) ---
+# Incremented whenever any stats change.  The random epoch distinguishes
+# process restarts, since the dummy data above does not survive them.
+_scores_epoch = uuid.uuid4().hex[:8]
+_scores_version = 0
+
 def initialize_database():
     """
     Checks if the required database and table exist.
@@ -79,8 +86,9 @@ def update_score(player_name: str, result: str):
     NOTE: The commented-out section is the intended code for an actual SQLite DB.
     Right now, it is replaced by an in-memory dictionary for demonstration.
     """
-    global _player_stats
+    global _player_stats, _scores_version
     _ensure_player_exists(player_name)  # Check if the player is in the dummy data
+    _scores_version += 1
 
     stats = _player_stats[player_name]
 
@@ -156,7 +164,8 @@ def reset_scores():
     NOTE: Replace with actual SQLite update if you want to persist 
     resets in the real database.
     """
-    global _player_stats
+    global _player_stats, _scores_version
+    _scores_version += 1
     for player in _player_stats:
         _player_stats[player] = {"score": 0, "win_streak": 0, "win_count": 0}
     print("Dummy scores have been reset.")
@@ -185,5 +194,12 @@ def get_scores() -> Dict[str, Dict[str, int]]:
     # Return a copy of the entire player-stats dictionary
     return {player: stats.copy() for player, stats in _player_stats.items()}
 
+def get_scores_version() -> str:
+    """
+    Returns an opaque token that changes every time the scoreboard changes.
+    The API uses it as the ETag of /api/get_scores.
+    """
+    return f"{_scores_epoch}-{_scores_version}"
+
 # --- Call initialization automatically upon module import ---
 initialize_database()
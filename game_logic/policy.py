@@ -0,0 +1,102 @@
+"""Exhaustively solved policy for classic 3×3 Tic‑Tac‑Toe.
+
+Classic Tic‑Tac‑Toe has only a few thousand reachable positions, so the
+optimal replies for the AI can be computed once and shipped to the browser,
+which then plays without a round trip to */api/play*.
+
+Encoding (kept deliberately small so it compresses well):
+
+* A board is mapped to an integer key by reading it as a base‑3 number where
+  cell *i* contributes ``digit * 3**i`` ("" → 0, "X" → 1, "O" → 2).
+* Each key maps to a 9‑bit mask of the squares that are optimal for the AI
+  (bit *i* set ⇒ square *i* is an optimal move).
+
+Scores follow :func:`game_logic.tictactoe.minimax` (+1 win, 0 tie, −1 loss,
+independent of depth), so the client plays exactly like the *hard* bot.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from game_logic.tictactoe import check_win_utility
+
+PLAYER_MARK = "X"
+AI_MARK = "O"
+
+# Bump whenever the encoding below changes so stale clients fall back.
+POLICY_VERSION = 1
+
+_DIGITS = {"": 0, PLAYER_MARK: 1, AI_MARK: 2}
+
+
+def board_key(board: List[str]) -> int:
+    """Return the base‑3 integer key of *board*."""
+    return sum(_DIGITS[cell] * 3 ** i for i, cell in enumerate(board))
+
+
+@lru_cache(maxsize=None)
+def _score(board: Tuple[str, ...], ai_to_move: bool) -> int:
+    """Minimax value of *board* from the AI's point of view.
+
+    The cache is unbounded, so only :func:`solve_policy` should feed it: it
+    visits each reachable position once.  Never call this with client input.
+    """
+    if check_win_utility(board, AI_MARK):
+        return 1
+    if check_win_utility(board, PLAYER_MARK):
+        return -1
+    moves = [i for i, cell in enumerate(board) if cell == ""]
+    if not moves:
+        return 0
+
+    mark = AI_MARK if ai_to_move else PLAYER_MARK
+    scores = [
+        _score(board[:i] + (mark,) + board[i + 1 :], not ai_to_move) for i in moves
+    ]
+    return max(scores) if ai_to_move else min(scores)
+
+
+def optimal_moves(board: List[str]) -> List[int]:
+    """Return every square that is optimal for the AI on *board*.
+
+    Used while building the table; check client boards against
+    :func:`solve_policy`'s result instead.
+    """
+    board = tuple(board)
+    moves = [i for i, cell in enumerate(board) if cell == ""]
+    if not moves:
+        return []
+    scores = {i: _score(board[:i] + (AI_MARK,) + board[i + 1 :], False) for i in moves}
+    best = max(scores.values())
+    return [i for i in moves if scores[i] == best]
+
+
+def solve_policy() -> Dict[int, int]:
+    """Return ``{board_key: optimal_move_mask}`` for every AI decision point.
+
+    Only positions reachable when the player (X) moves first are included:
+    X has exactly one more mark than O and nobody has won yet.
+    """
+    policy: Dict[int, int] = {}
+    seen = set()
+
+    def visit(board: List[str], ai_to_move: bool):
+        key = board_key(board)
+        if key in seen:
+            return
+        seen.add(key)
+        if check_win_utility(board, AI_MARK) or check_win_utility(board, PLAYER_MARK):
+            return
+        moves = [i for i, cell in enumerate(board) if cell == ""]
+        if not moves:
+            return
+        if ai_to_move:
+            policy[key] = sum(1 << i for i in optimal_moves(board))
+        mark = AI_MARK if ai_to_move else PLAYER_MARK
+        for i in moves:
+            board[i] = mark
+            visit(board, not ai_to_move)
+            board[i] = ""  # Undo move
+
+    visit([""] * 9, ai_to_move=False)
+    return policy
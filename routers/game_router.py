@@ -1,10 +1,12 @@
 # === routers/game_router.py ===
 """REST API endpoints for playing the game and managing player statistics."""
 
-from fastapi import APIRouter, HTTPException, Body
+from fastapi import APIRouter, HTTPException, Body, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict  # Added Dict for type annotation
+from typing import List, Optional, Dict, Literal  # Added Dict for type annotation
 from enum import Enum
+import json
 
 # Import game logic and database helper functions
 from game_logic.tictactoe import (
@@ -13,9 +15,39 @@ from game_logic.tictactoe import (
     is_board_full_utility,
 )
 from game_logic import database  # Database abstraction layer
+from game_logic import policy  # Solved 3×3 policy for client‑side AI
+from game_logic.admission import AdmissionController, AdmissionRejected
+from routers.http_cache import (
+    CachedAsset,
+    REVALIDATE_CACHE,
+    etag_matches,
+    not_modified,
+)
 
 router = APIRouter()
 
+# Limits concurrent AI computations per difficulty / board size so a burst of
+# expensive requests cannot starve cheap endpoints such as /health.
+ai_admission = AdmissionController.from_env()
+
+# The solved policy never changes while the process runs, so it is encoded,
+# compressed and given an ETag once.  Clients may cache it for a day.  The
+# table is also kept to spot-check client moves without running Minimax.
+POLICY_CACHE = "public, max-age=86400"
+policy_table = policy.solve_policy()
+policy_asset = CachedAsset(
+    json.dumps(
+        {
+            "version": policy.POLICY_VERSION,
+            "ai_mark": policy.AI_MARK,
+            "player_mark": policy.PLAYER_MARK,
+            "moves": {str(key): mask for key, mask in policy_table.items()},
+        },
+        separators=(",", ":"),
+    ).encode("utf-8"),
+    "application/json",
+)
+
 # ----------------------------------------------------------------------------
 # Data models (Pydantic) ------------------------------------------------------
 # ----------------------------------------------------------------------------
@@ -43,6 +75,23 @@ class PlayResponse(BaseModel):
     is_tie: bool = False
     message: str
     ai_move: Optional[int] = None  # Index (0‑8) chosen by the AI
+    difficulty_used: Optional[str] = None  # Lower than requested when degraded
+
+
+class MoveCheckRequest(BaseModel):
+    """A move computed by the client‑side AI, sent back for spot‑checking."""
+
+    board: List[Literal["", "X", "O"]] = Field(..., min_length=9, max_length=9)  # Before the AI move
+    ai_move: int = Field(..., ge=0, le=8)
+    difficulty: DifficultyLevel = DifficultyLevel.HARD
+
+
+class MoveCheckResponse(BaseModel):
+    """Result of verifying a client‑side AI move."""
+
+    legal: bool  # Reachable position with the AI to move, and the square was empty
+    optimal: bool  # Move is one of the solved policy's best moves
+    valid: bool  # Legal, and optimal too when difficulty is 'hard'
 
 
 class ScoreUpdateRequest(BaseModel):
@@ -113,8 +162,21 @@ async def play_turn(request: PlayRequest):
 
     # ---------------------------------------------------------------------
     # Ask the AI to choose a move based on the current board & difficulty.
+    # Minimax runs in the thread pool so it never blocks the event loop, and
+    # only after the admission controller granted a slot.
     # ---------------------------------------------------------------------
-    ai_move_index = get_ai_move(current_board, ai_mark, difficulty)
+    try:
+        async with ai_admission.slot(difficulty, len(current_board)) as difficulty_used:
+            ai_move_index = await run_in_threadpool(
+                get_ai_move, current_board, ai_mark, difficulty_used
+            )
+    except AdmissionRejected as e:
+        print(f"Rejecting AI request: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="AI is busy, please retry shortly.",
+            headers={"Retry-After": str(e.retry_after)},
+        )
 
     # Prepare response defaults ------------------------------------------------
     new_board = current_board[:]
@@ -158,9 +220,45 @@ async def play_turn(request: PlayRequest):
         is_tie=is_tie,
         message=message,
         ai_move=ai_move_index,
+        difficulty_used=difficulty_used,
     )
 
 
+# ----------------------------------------------------------------------------
+# Client‑side AI support -------------------------------------------------------
+# ----------------------------------------------------------------------------
+
+@router.get("/policy")
+async def get_policy(request: Request):
+    """Return the solved 3×3 policy so the browser can play without /play."""
+
+    return policy_asset.response(request, POLICY_CACHE)
+
+
+@router.post("/check_move", response_model=MoveCheckResponse)
+async def check_move(request: MoveCheckRequest):
+    """Spot‑check a move that the client‑side AI made.
+
+    Front‑ends only send a sample of their moves here; the server verifies the
+    move is legal and, for *hard*, that it matches the solved policy.  Boards
+    that are not in the policy table (finished, unreachable or not the AI's
+    turn) are rejected, so client input never reaches Minimax.
+    """
+
+    board = request.board
+    mask = policy_table.get(policy.board_key(board))
+    legal = mask is not None and board[request.ai_move] == ""
+    optimal = legal and bool(mask & (1 << request.ai_move))
+    valid = optimal if request.difficulty == DifficultyLevel.HARD else legal
+
+    if not valid:
+        print(
+            f"Warning: client AI move {request.ai_move} failed spot-check "
+            f"(difficulty={request.difficulty.value}, board={board})"
+        )
+    return MoveCheckResponse(legal=legal, optimal=optimal, valid=valid)
+
+
 # ----------------------------------------------------------------------------
 # Score management endpoints --------------------------------------------------
 # ----------------------------------------------------------------------------
@@ -180,8 +278,18 @@ async def update_player_score(request: ScoreUpdateRequest):
 
 
 @router.get("/get_scores", response_model=ScoreResponse)
-async def get_all_scores():
-    """Return stats (score, win_streak, win_count) for every player."""
+async def get_all_scores(request: Request, response: Response):
+    """Return stats (score, win_streak, win_count) for every player.
+
+    The ETag follows the scoreboard version, so clients revalidating an
+    unchanged scoreboard receive an empty 304 instead of the full JSON.
+    """
+
+    etag = f'"scores-{database.get_scores_version()}"'
+    if etag_matches(request, etag):
+        return not_modified(etag, REVALIDATE_CACHE)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = REVALIDATE_CACHE
 
     try:
         # *database.get_scores()* should return a dict compatible with ScoreResponse.
@@ -0,0 +1,98 @@
+"""HTTP caching helpers shared by the routers.
+
+Provides ETag / If-None-Match handling and :class:`CachedAsset`, an in‑memory
+payload stored once in every encoding the server can offer (identity, gzip,
+and brotli when the optional ``brotli`` package is installed).
+"""
+
+import gzip
+import hashlib
+from typing import Dict
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:  # Brotli is optional – fall back to gzip only when it is missing.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# Responses smaller than this are not worth compressing.
+MIN_COMPRESS_SIZE = 256
+
+
+# ----------------------------------------------------------------------------
+# Conditional request helpers -------------------------------------------------
+# ----------------------------------------------------------------------------
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Return *True* if the request's If-None-Match header matches *etag*."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110) – ignore the W/ prefix on either side.
+    wanted = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == wanted:
+            return True
+    return False
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """Build an empty 304 response carrying the validator headers."""
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"},
+    )
+
+
+# ----------------------------------------------------------------------------
+# Precompressed in‑memory asset ------------------------------------------------
+# ----------------------------------------------------------------------------
+
+class CachedAsset:
+    """Identity, gzip and brotli encodings of one payload plus its ETag."""
+
+    def __init__(self, content: bytes, media_type: str):
+        self.media_type = media_type
+        self.digest = hashlib.sha256(content).hexdigest()[:16]
+        self.encodings: Dict[str, bytes] = {"identity": content}
+        if len(content) >= MIN_COMPRESS_SIZE:
+            self.encodings["gzip"] = gzip.compress(content, compresslevel=9, mtime=0)
+            if brotli is not None:
+                self.encodings["br"] = brotli.compress(content, quality=11)
+
+    def _negotiate(self, request: Request) -> str:
+        """Pick the smallest encoding the client accepts."""
+        accepted = {
+            part.split(";")[0].strip().lower()
+            for part in request.headers.get("accept-encoding", "").split(",")
+        }
+        for encoding in ("br", "gzip"):
+            if encoding in self.encodings and encoding in accepted:
+                return encoding
+        return "identity"
+
+    def response(self, request: Request, cache_control: str) -> Response:
+        """Return the asset (or a 304) in the best encoding for *request*."""
+        encoding = self._negotiate(request)
+        # Each representation gets its own ETag so caches never mix them up.
+        suffix = "" if encoding == "identity" else f"-{encoding}"
+        etag = f'"{self.digest}{suffix}"'
+        if etag_matches(request, etag):
+            return not_modified(etag, cache_control)
+
+        headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=self.encodings[encoding], media_type=self.media_type, headers=headers
+        )
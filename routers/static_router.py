@@ -0,0 +1,77 @@
+"""Cache‑friendly serving of the front‑end assets.
+
+*app.py* calls :func:`load_assets` once at startup, which reads every file in
+*static/*, hashes it and precompresses it (see :class:`CachedAsset`).  Files
+are then reachable under two URLs:
+
+* ``/static/style.<hash>.css`` – content‑hashed, cached forever (immutable).
+* ``/static/style.css``        – stable name, always revalidated via ETag.
+
+The template uses :func:`asset_url` so the page always links the hashed URLs.
+"""
+
+import mimetypes
+import os
+from typing import Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+
+from routers.http_cache import CachedAsset, IMMUTABLE_CACHE, REVALIDATE_CACHE
+
+router = APIRouter()
+
+
+# ----------------------------------------------------------------------------
+# Asset manifest (built once by load_assets) ----------------------------------
+# ----------------------------------------------------------------------------
+
+# Plain name ("style.css") → asset, and hashed name → plain name.
+_assets: Dict[str, CachedAsset] = {}
+_hashed_names: Dict[str, str] = {}
+_public_names: Dict[str, str] = {}
+
+
+def _hashed_name(name: str, digest: str) -> str:
+    root, ext = os.path.splitext(name)
+    return f"{root}.{digest[:10]}{ext}"
+
+
+def load_assets(static_dir: str):
+    """Read, hash and precompress every file below *static_dir*."""
+    _assets.clear()
+    _hashed_names.clear()
+    _public_names.clear()
+    for dirpath, _, filenames in os.walk(static_dir):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            name = os.path.relpath(path, static_dir).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                content = f.read()
+            media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            asset = CachedAsset(content, media_type)
+            hashed = _hashed_name(name, asset.digest)
+            _assets[name] = asset
+            _hashed_names[hashed] = name
+            _public_names[name] = hashed
+    print(f"Loaded {len(_assets)} static assets from {static_dir}")
+
+
+def asset_url(name: str) -> str:
+    """Return the content‑hashed URL of static file *name* (used in templates)."""
+    return f"/static/{_public_names.get(name, name)}"
+
+
+# ----------------------------------------------------------------------------
+# HTTP endpoint ---------------------------------------------------------------
+# ----------------------------------------------------------------------------
+
+@router.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def serve_static(path: str, request: Request):
+    """Serve a static file from memory with cache and encoding negotiation."""
+    if path in _hashed_names:
+        # The URL changes whenever the content does, so cache it forever.
+        return _assets[_hashed_names[path]].response(request, IMMUTABLE_CACHE)
+    asset: Optional[CachedAsset] = _assets.get(path)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return asset.response(request, REVALIDATE_CACHE)
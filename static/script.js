@@ -48,6 +48,11 @@ document.addEventListener('DOMContentLoaded', () => {
     let currentDifficulty = 'easy';                            // default; updated by initializeDifficulty()
     const resetDelay   = 3000;                                 // ms to wait before starting next round
 
+    //  Client‑side AI (solved 3×3 policy served by /api/policy)
+    let aiPolicy       = null;                                 // null → fall back to /api/play
+    const policyVersion = 1;                                   // encoding understood by this script
+    const spotCheckRate = 0.05;                                // share of local moves sent to /api/check_move
+
     // --------------------------------------------------------
     //  Initialise difficulty from UI (called on page load)
     // --------------------------------------------------------
@@ -196,9 +201,25 @@ document.addEventListener('DOMContentLoaded', () => {
         // optional small delay for realism
         await new Promise(resolve => setTimeout(resolve, 250));
 
+        // play locally when the solved policy is available (no server round trip)
+        if (aiPolicy) {
+            playLocalAIMove();
+            if (checkLocalWin(botMark)) {
+                updateStatus("AI (O) wins!");
+                await handleGameOver("Player1", "loss");
+            } else if (isBoardFull()) {
+                updateStatus("It's a tie!");
+                await handleGameOver("Player1", "tie");
+            } else {
+                updateStatus("AI moved. Your turn.");
+                gameActive = true; // continue game
+            }
+            return;
+        }
+
         try {
             // send current board + difficulty to backend
-            const response = await fetch('/api/play', {
+            const requestAIMove = () => fetch('/api/play', {
                 method : 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body   : JSON.stringify({
@@ -206,6 +227,15 @@ document.addEventListener('DOMContentLoaded', () => {
                     difficulty: currentDifficulty
                 }),
             });
+            let response = await requestAIMove();
+
+            // server is overloaded → wait as instructed by Retry-After, then retry once
+            if (response.status === 503) {
+                const retryAfter = parseInt(response.headers.get('Retry-After'), 10) || 1;
+                updateStatus(`AI is busy, retrying in ${retryAfter}s...`);
+                await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
+                response = await requestAIMove();
+            }
 
             if (!response.ok) {
                 // attempt to parse JSON error; fallback generic
@@ -234,6 +264,64 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
 
+    // --------------------------------------------------------
+    //  Client‑side AI helpers (mirror game_logic/tictactoe.py)
+    // --------------------------------------------------------
+    async function loadPolicy() {
+        // GET /api/policy → { moves: { base‑3 board key: optimal‑move bitmask } }
+        try {
+            const response = await fetch('/api/policy');
+            if (!response.ok) throw new Error(`Failed to fetch policy. Status: ${response.status}`);
+            const data = await response.json();
+
+            // only trust a table in the expected encoding and with our marks
+            if (data.version !== policyVersion || data.ai_mark !== botMark || data.player_mark !== playerMark) {
+                throw new Error(`Unsupported policy (version ${data.version}, ai ${data.ai_mark}, player ${data.player_mark})`);
+            }
+            aiPolicy = data;
+            console.log("Loaded AI policy with", Object.keys(aiPolicy.moves).length, "positions");
+        } catch (error) {
+            console.error("Error loading AI policy, using server AI:", error);
+            aiPolicy = null;
+        }
+    }
+
+    function boardKey(board) {
+        // "" → 0, X → 1, O → 2; cell i is the i‑th base‑3 digit
+        return board.reduce((key, cell, index) =>
+            key + (cell === playerMark ? 1 : cell === botMark ? 2 : 0) * 3 ** index, 0);
+    }
+
+    function playLocalAIMove() {
+        const boardBefore = currentBoard.slice();
+        const available   = currentBoard
+            .map((cell, index) => (cell === "" ? index : null))
+            .filter(index => index !== null);
+        const randomMove  = () => available[Math.floor(Math.random() * available.length)];
+
+        // easy → random; medium → 50 % random; hard → solved policy
+        let move;
+        if (currentDifficulty === 'easy' || (currentDifficulty === 'medium' && Math.random() < 0.5)) {
+            move = randomMove();
+        } else {
+            const mask    = aiPolicy.moves[boardKey(currentBoard)] || 0;
+            const optimal = available.filter(index => mask & (1 << index));
+            move = optimal.length ? optimal[Math.floor(Math.random() * optimal.length)] : randomMove();
+        }
+
+        currentBoard[move] = botMark;
+        updateBoardDisplay();
+
+        // let the server verify a sample of moves (fire‑and‑forget)
+        if (Math.random() < spotCheckRate) {
+            fetch('/api/check_move', {
+                method : 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body   : JSON.stringify({ board: boardBefore, ai_move: move, difficulty: currentDifficulty }),
+            }).catch(error => console.error("Error sending move spot-check:", error));
+        }
+    }
+
     // --------------------------------------------------------
     //  Utility helpers (pure JS, no server calls)
     // --------------------------------------------------------
@@ -398,5 +486,6 @@ document.addEventListener('DOMContentLoaded', () => {
     initializeDifficulty();  // set difficulty + theme
     createBoard();           // render empty board
     fetchScores();           // pull scores from backend
+    loadPolicy();            // enable client‑side AI once the policy arrives
     updateStatus("Your turn (X)");
 });